@@ -2,32 +2,69 @@
 import streamlit as st
 import pandas as pd
 import io
+import hashlib
 from datetime import datetime
+from functools import lru_cache
+from collections import namedtuple
 import numpy as np
-import math
 import os
+from types import MappingProxyType
 
 # =====================================================
 # SAFE CSV READER
 # =====================================================
 
+# every spelling of NaN / +-INF is turned into NaN by the parser itself,
+# so a single fillna(0) cleans the frame
+_NA_VALUES = ['NaN','NAN','nan','',' ','NULL','null'] + [
+    sign + inf
+    for sign in ('', '+', '-')
+    for inf in ('inf', 'Inf', 'INF', 'infinity', 'Infinity', 'INFINITY')
+]
+
+# flag / mode columns narrowed to int8; setpoints keep their parsed dtype
+_SMALL_INT_COLUMNS = (
+    'TST_APFlag', 'TST_MeasurementReq', 'TST_TorqueCheck', 'TST_TestMode'
+)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _read_csv_cached(source, mtime=None):
+    # `source` is a path or the raw bytes of an upload; `mtime` only keys the cache
+    if isinstance(source, bytes):
+        data = source
+    else:
+        with open(source, 'rb') as f:
+            data = f.read()
+
+    # decode once in memory, then parse once
+    encodings = ['utf-8-sig', 'cp1252', 'latin-1']
+    for enc in encodings:
+        try:
+            text = data.decode(enc)
+            break
+        except UnicodeDecodeError:
+            continue
+
+    df = pd.read_csv(
+        io.StringIO(text),
+        delimiter=';',
+        na_values=_NA_VALUES,
+        keep_default_na=True,
+        skipinitialspace=True
+    )
+    df = df.fillna(0)
+    for col in _SMALL_INT_COLUMNS:
+        if (col in df.columns and pd.api.types.is_numeric_dtype(df[col])
+                and df[col].mod(1).eq(0).all()
+                and df[col].between(-128, 127).all()):
+            df[col] = df[col].astype('int8')
+    return df
+
 def safe_read_csv(file_path_or_buffer):
     try:
-        encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-        for enc in encodings:
-            try:
-                df = pd.read_csv(
-                    file_path_or_buffer,
-                    delimiter=';',
-                    encoding=enc,
-                    na_values=['NaN','NAN','nan','INF','INFINITY','inf','infinity','',' ','NULL','null'],
-                    keep_default_na=True,
-                    skipinitialspace=True
-                )
-                return df.replace([np.nan, math.inf, -math.inf], 0)
-            except Exception:
-                continue
-        return pd.read_csv(file_path_or_buffer, delimiter=';')
+        if hasattr(file_path_or_buffer, 'getvalue'):
+            return _read_csv_cached(file_path_or_buffer.getvalue())
+        return _read_csv_cached(file_path_or_buffer, os.path.getmtime(file_path_or_buffer))
     except Exception as e:
         st.error(f"CSV read error: {e}")
         return pd.DataFrame()
@@ -36,11 +73,15 @@ def safe_read_csv(file_path_or_buffer):
 # FILE TYPE DETECTION
 # =====================================================
 
+# machine or technician column name that identifies each seal type
+_MAIN_SENTINELS = frozenset({'TST_CellPresDemand', 'Primary seal Gas Pressure (barg)'})
+_SEP_SENTINELS = frozenset({'TST_SepSealFlwSet1', 'Sep_Seal_Flow_Set1'})
+
 def detect_file_type(df):
-    cols = df.columns.tolist()
-    if 'TST_CellPresDemand' in cols or 'Primary seal Gas Pressure (barg)' in cols:
+    cols = df.columns
+    if not _MAIN_SENTINELS.isdisjoint(cols):
         return 'main_seal'
-    if 'TST_SepSealFlwSet1' in cols or 'Sep_Seal_Flow_Set1' in cols:
+    if not _SEP_SENTINELS.isdisjoint(cols):
         return 'separation_seal'
     return 'unknown'
 
@@ -48,75 +89,67 @@ def detect_file_type(df):
 # COLUMN MAPPINGS
 # =====================================================
 
+_MAIN_M2T = {
+    'TST_SpeedDem': 'Speed_RPM',
+    'TST_CellPresDemand': 'Primary seal Gas Pressure (barg)',
+    'TST_InterPresDemand': 'Interspace_Pressure_bar',
+    'TST_InterBPDemand_DE': 'BackPressure_Drive_End_bar',
+    'TST_InterBPDemand_NDE': 'BackPressure_Non_Drive_End_bar',
+    'TST_GasInjectionDemand': 'Gas_Injection_bar',
+    'TST_StepDuration': 'Duration_s',
+    'TST_APFlag': 'Auto_Proceed',
+    'TST_TempDemand': 'Temperature_C',
+    'TST_GasType': 'Gas_Type',
+    'TST_TestMode': 'Test_Mode',
+    'TST_MeasurementReq': 'Measurement',
+    'TST_TorqueCheck': 'Torque_Check'
+}
+
+_SEP_M2T = {
+    'TST_SpeedDem': 'Speed_RPM',
+    'TST_SepSealFlwSet1': 'Sep_Seal_Flow_Set1',
+    'TST_SepSealFlwSet2': 'Sep_Seal_Flow_Set2',
+    'TST_SepSealPSet1': 'Sep_Seal_Pressure_Set1',
+    'TST_SepSealPSet2': 'Sep_Seal_Pressure_Set2',
+    'TST_SepSealControlTyp': 'Sep_Seal_Control_Type',
+    'TST_StepDuration': 'Duration_s',
+    'TST_APFlag': 'Auto_Proceed',
+    'TST_TempDemand': 'Temperature_C',
+    'TST_GasType': 'Gas_Type',
+    'TST_MeasurementReq': 'Measurement',
+    'TST_TorqueCheck': 'Torque_Check'
+}
+
+def _freeze_mapping(machine_to_technician):
+    # reverse direction is derived so each seal type has one source of truth
+    return MappingProxyType({
+        'machine_to_technician': MappingProxyType(dict(machine_to_technician)),
+        'technician_to_machine': MappingProxyType(
+            {v: k for k, v in machine_to_technician.items()}
+        )
+    })
+
+_COLUMN_MAPPINGS = {
+    'main_seal': _freeze_mapping(_MAIN_M2T),
+    'separation_seal': _freeze_mapping(_SEP_M2T)
+}
+
 def get_column_mapping(file_type):
+    return _COLUMN_MAPPINGS.get(file_type)
+
+# =====================================================
+# BUILT-IN TEMPLATES
+# =====================================================
 
-    if file_type == 'main_seal':
-        return {
-            'machine_to_technician': {
-                'TST_SpeedDem': 'Speed_RPM',
-                'TST_CellPresDemand': 'Primary seal Gas Pressure (barg)',
-                'TST_InterPresDemand': 'Interspace_Pressure_bar',
-                'TST_InterBPDemand_DE': 'BackPressure_Drive_End_bar',
-                'TST_InterBPDemand_NDE': 'BackPressure_Non_Drive_End_bar',
-                'TST_GasInjectionDemand': 'Gas_Injection_bar',
-                'TST_StepDuration': 'Duration_s',
-                'TST_APFlag': 'Auto_Proceed',
-                'TST_TempDemand': 'Temperature_C',
-                'TST_GasType': 'Gas_Type',
-                'TST_TestMode': 'Test_Mode',
-                'TST_MeasurementReq': 'Measurement',
-                'TST_TorqueCheck': 'Torque_Check'
-            },
-            'technician_to_machine': {
-                'Speed_RPM': 'TST_SpeedDem',
-                'Primary seal Gas Pressure (barg)': 'TST_CellPresDemand',
-                'Interspace_Pressure_bar': 'TST_InterPresDemand',
-                'BackPressure_Drive_End_bar': 'TST_InterBPDemand_DE',
-                'BackPressure_Non_Drive_End_bar': 'TST_InterBPDemand_NDE',
-                'Gas_Injection_bar': 'TST_GasInjectionDemand',
-                'Duration_s': 'TST_StepDuration',
-                'Auto_Proceed': 'TST_APFlag',
-                'Temperature_C': 'TST_TempDemand',
-                'Gas_Type': 'TST_GasType',
-                'Test_Mode': 'TST_TestMode',
-                'Measurement': 'TST_MeasurementReq',
-                'Torque_Check': 'TST_TorqueCheck'
-            }
-        }
-
-    if file_type == 'separation_seal':
-        return {
-            'machine_to_technician': {
-                'TST_SpeedDem': 'Speed_RPM',
-                'TST_SepSealFlwSet1': 'Sep_Seal_Flow_Set1',
-                'TST_SepSealFlwSet2': 'Sep_Seal_Flow_Set2',
-                'TST_SepSealPSet1': 'Sep_Seal_Pressure_Set1',
-                'TST_SepSealPSet2': 'Sep_Seal_Pressure_Set2',
-                'TST_SepSealControlTyp': 'Sep_Seal_Control_Type',
-                'TST_StepDuration': 'Duration_s',
-                'TST_APFlag': 'Auto_Proceed',
-                'TST_TempDemand': 'Temperature_C',
-                'TST_GasType': 'Gas_Type',
-                'TST_MeasurementReq': 'Measurement',
-                'TST_TorqueCheck': 'Torque_Check'
-            },
-            'technician_to_machine': {
-                'Speed_RPM': 'TST_SpeedDem',
-                'Sep_Seal_Flow_Set1': 'TST_SepSealFlwSet1',
-                'Sep_Seal_Flow_Set2': 'TST_SepSealFlwSet2',
-                'Sep_Seal_Pressure_Set1': 'TST_SepSealPSet1',
-                'Sep_Seal_Pressure_Set2': 'TST_SepSealPSet2',
-                'Sep_Seal_Control_Type': 'TST_SepSealControlTyp',
-                'Duration_s': 'TST_StepDuration',
-                'Auto_Proceed': 'TST_APFlag',
-                'Temperature_C': 'TST_TempDemand',
-                'Gas_Type': 'TST_GasType',
-                'Measurement': 'TST_MeasurementReq',
-                'Torque_Check': 'TST_TorqueCheck'
-            }
-        }
-
-    return None
+# seal type shown in the UI -> (file_type, bundled machine CSV)
+_FILE_TYPE_REGISTRY = {
+    'Main Seal': ('main_seal', 'MainSealSet2.csv'),
+    'Separation Seal': ('separation_seal', 'SeperationSeal.csv')
+}
+
+def load_template(seal):
+    file_type, csv_file = _FILE_TYPE_REGISTRY[seal]
+    return file_type, safe_read_csv(os.path.join(os.path.dirname(__file__), csv_file))
 
 # =====================================================
 # CONVERSIONS
@@ -130,23 +163,49 @@ def convert_machine_to_technician(df, file_type):
         tech_df['Notes'] = ''
     return tech_df
 
+# readable labels and numeric codes, compared after strip + upper-casing
+_YES_CODES = ('YES', '1', '1.0')
+_MODE_2_CODES = ('MODE 2', '2', '2.0')
+
+def _normalized_labels(series):
+    return series.astype('string').str.strip().str.upper()
+
 def convert_to_machine_codes(df):
     df = df.copy()
-    for col in ['TST_APFlag','TST_MeasurementReq','TST_TorqueCheck']:
-        if col in df.columns:
-            df[col] = df[col].map({'Yes':1,'No':0}).fillna(0)
+    flag_cols = [c for c in ('TST_APFlag','TST_MeasurementReq','TST_TorqueCheck') if c in df.columns]
+    if flag_cols:
+        df[flag_cols] = df[flag_cols].apply(_normalized_labels).isin(_YES_CODES).astype('int8')
     if 'TST_TestMode' in df.columns:
-        df['TST_TestMode'] = df['TST_TestMode'].map({'Mode 1':1,'Mode 2':2}).fillna(1)
+        mode_2 = _normalized_labels(df['TST_TestMode']).isin(_MODE_2_CODES)
+        df['TST_TestMode'] = np.where(mode_2, np.int8(2), np.int8(1))
     return df
 
+@st.cache_data(show_spinner=False, max_entries=16)
+def create_machine_csv(technician_df, file_type):
+    # cached on the edited frame so reruns don't re-code an unchanged sequence
+    to_machine = get_column_mapping(file_type)['technician_to_machine']
+    machine_df = convert_to_machine_codes(
+        technician_df.set_axis([to_machine.get(c, c) for c in technician_df.columns], axis=1)
+    ).drop(columns=['Step','Notes'], errors='ignore')
+    return machine_df.to_csv(index=False, sep=';')
+
 # =====================================================
 # EDITABLE DATAFRAME
 # =====================================================
 
+def _frame_signature(df):
+    # column labels + a digest of the row hashes; cheap for sequence-sized frames
+    rows = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return tuple(df.columns), hashlib.blake2b(rows.tobytes(), digest_size=16).digest()
+
 def editable_dataframe(df, key, height=500):
 
-    if key not in st.session_state:
+    # reseed the editor when the source frame changes (new upload, other seal
+    # type); reruns on the same source keep the applied edits
+    sig = _frame_signature(df)
+    if st.session_state.get(f"{key}_sig") != sig:
         st.session_state[key] = df.copy()
+        st.session_state[f"{key}_sig"] = sig
 
     with st.form(f"form_{key}"):
 
@@ -169,40 +228,99 @@ def editable_dataframe(df, key, height=500):
 # PROFESSIONAL EXCEL EXPORT (FIXED LOGO ONLY)
 # =====================================================
 
+_FORMATS = {
+    'header': {
+        'bold': True,
+        'text_wrap': True,
+        'align': 'center',
+        'border': 1,
+        'fg_color': '#366092',
+        'font_color': 'white'
+    },
+    'cell': {'border': 1, 'align': 'center'},
+    'notes': {'border': 1, 'align': 'left'},
+    'title': {'bold': True, 'font_size': 14, 'font_color': '#366092'},
+    'instr_header': {'bold': True, 'font_color': '#366092'}
+}
+
+_ExcelFormats = namedtuple('_ExcelFormats', _FORMATS)
+
+def _add_formats(wb):
+    return _ExcelFormats(**{name: wb.add_format(props) for name, props in _FORMATS.items()})
+
+# INSTRUCTIONS sheet body between the title and the field list
+_INSTRUCTION_LINES = (
+    "",
+    "HOW TO USE THIS FILE:",
+    "1. This file contains your current test sequence",
+    "2. All cells have proper borders and formatting",
+    "3. Dropdown menus are included for standardized inputs",
+    "4. You can edit this file and upload it back to the web app",
+    "5. Use the conversion tool to generate machine CSV files",
+    "6.make sure you log test id NOT INCLUDED HERE",
+    "7.make sure you log seal sizeNOT INCLUDED HERE",
+    "8.make sure you log DE CARTRIDGE NOT INCLUDED HERE",
+    "9.MAKE SURE YOU LOG NDE CARTRIDGE NOT INCLUDED HERE",
+    "10. MAKE SURE YOU LOG PROJECT NUMBER+NAME NOT INCLUDED HERE",
+    "11. MAKE SURE TO LOGE THE DISCRIPTION+GA NOT INCLUDED HERE ",
+    "12. MAKE SURE TO LOG OPERATOR NAME. NOT INCLUDED HERE",
+    "",
+    "FIELD DESCRIPTIONS:"
+)
+_INSTRUCTION_HEADERS = frozenset({"HOW TO USE THIS FILE:", "FIELD DESCRIPTIONS:"})
+
+@lru_cache(maxsize=1)
+def _logo_path():
+    # resolved on first export only; None when the logo isn't shipped
+    path = os.path.join(os.path.dirname(__file__), "company_logo.png")
+    return path if os.path.exists(path) else None
+
 def create_professional_excel_from_data(technician_df, file_type):
+    # workbook bytes are cached per (frame contents, file type, export date)
+    date = datetime.now().strftime('%Y-%m-%d')
+    return _build_professional_excel(technician_df, file_type, date)
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _build_professional_excel(technician_df, file_type, date):
     output = io.BytesIO()
-    logo_path = os.path.join(os.path.dirname(__file__), "company_logo.png")
+    logo_path = _logo_path()
+
+    # constant_memory flushes each row once the next one starts, so every
+    # sheet below is written strictly top to bottom. Notes are free text and
+    # are kept as plain strings, never turned into formulas or hyperlinks.
+    with pd.ExcelWriter(
+        output, engine='xlsxwriter',
+        engine_kwargs={'options': {
+            'constant_memory': True,
+            'strings_to_formulas': False,
+            'strings_to_urls': False
+        }}
+    ) as workbook:
+        wb = workbook.book
+        ws = wb.add_worksheet('TEST_SEQUENCE')
 
-    with pd.ExcelWriter(output, engine='xlsxwriter') as workbook:
-        technician_df.to_excel(workbook, sheet_name='TEST_SEQUENCE', index=False)
+        fmt = _add_formats(wb)
 
-        wb = workbook.book
-        ws = workbook.sheets['TEST_SEQUENCE']
-
-        header = wb.add_format({
-            'bold': True,
-            'text_wrap': True,
-            'align': 'center',
-            'border': 1,
-            'fg_color': '#366092',
-            'font_color': 'white'
-        })
-        cell = wb.add_format({'border': 1, 'align': 'center'})
-        notes = wb.add_format({'border': 1, 'align': 'left'})
-
-        for c, col in enumerate(technician_df.columns):
-            ws.write(0, c, col, header)
-
-        for r in range(1, len(technician_df)+1):
-            for c, col in enumerate(technician_df.columns):
-                ws.write(r, c, technician_df.iloc[r-1, c], notes if col=='Notes' else cell)
+        columns = list(technician_df.columns)
+        notes_col = columns.index('Notes') if 'Notes' in columns else None
+
+        # each cell is written exactly once; Notes is split out of the row
+        # rather than overwritten with its own format afterwards
+        ws.write_row(0, 0, columns, fmt.header)
+        for r, row in enumerate(technician_df.itertuples(index=False, name=None), 1):
+            if notes_col is None:
+                ws.write_row(r, 0, row, fmt.cell)
+                continue
+            ws.write_row(r, 0, row[:notes_col], fmt.cell)
+            ws.write(r, notes_col, row[notes_col], fmt.notes)
+            ws.write_row(r, notes_col+1, row[notes_col+1:], fmt.cell)
 
         ws.set_column(0, len(technician_df.columns)-1, 18)
 
         instr = wb.add_worksheet('INSTRUCTIONS')
 
         # ---- FIXED LOGO ON LEFT ----
-        if os.path.exists(logo_path):
+        if logo_path:
             instr.set_column('A:A', 32)
             instr.set_row(0, 120)
             instr.insert_image(
@@ -211,88 +329,60 @@ def create_professional_excel_from_data(technician_df, file_type):
                 {'x_offset': 10, 'y_offset': 10, 'x_scale': 0.6, 'y_scale': 0.6}
             )
 
-        date = datetime.now().strftime('%Y-%m-%d')
         title = f"{'MAIN SEAL' if file_type=='main_seal' else 'SEPARATION SEAL'} TEST SEQUENCE - EXPORTED {date}"
 
-        instructions = [
-            title,"",
-            "HOW TO USE THIS FILE:",
-            "1. This file contains your current test sequence",
-            "2. All cells have proper borders and formatting",
-            "3. Dropdown menus are included for standardized inputs",
-            "4. You can edit this file and upload it back to the web app",
-            "5. Use the conversion tool to generate machine CSV files",
-            "6.make sure you log test id NOT INCLUDED HERE",
-            "7.make sure you log seal sizeNOT INCLUDED HERE",
-            "8.make sure you log DE CARTRIDGE NOT INCLUDED HERE",
-            "9.MAKE SURE YOU LOG NDE CARTRIDGE NOT INCLUDED HERE",
-            "10. MAKE SURE YOU LOG PROJECT NUMBER+NAME NOT INCLUDED HERE",
-            "11. MAKE SURE TO LOGE THE DISCRIPTION+GA NOT INCLUDED HERE ",
-            "12. MAKE SURE TO LOG OPERATOR NAME. NOT INCLUDED HERE",
-            "",
-            "FIELD DESCRIPTIONS:"
-        ] + list(technician_df.columns)
-
-        title_fmt = wb.add_format({'bold': True, 'font_size': 14, 'font_color': '#366092'})
-        header_fmt = wb.add_format({'bold': True, 'font_color': '#366092'})
+        instructions = [title, *_INSTRUCTION_LINES, *technician_df.columns]
 
         start_row = 12
         for r, text in enumerate(instructions):
             row = start_row + r
             if r == 0:
-                instr.write(row, 1, text, title_fmt)
-            elif text in ["HOW TO USE THIS FILE:", "FIELD DESCRIPTIONS:"]:
-                instr.write(row, 1, text, header_fmt)
+                instr.write(row, 1, text, fmt.title)
+            elif text in _INSTRUCTION_HEADERS:
+                instr.write(row, 1, text, fmt.instr_header)
             else:
                 instr.write(row, 1, text)
 
         instr.set_column('B:B', 75)
 
-    output.seek(0)
-    return output
+    return output.getvalue()
 
 # =====================================================
 # MAIN APP
 # =====================================================
 
+_OPERATIONS = (
+    "📥 Download Template", "🔄 Excel to Machine CSV",
+    "📤 Machine CSV to Excel", "👀 View Current Test"
+)
+_SEAL_TYPES = tuple(_FILE_TYPE_REGISTRY)
+
 def main():
     st.title("⚙️ Universal Seal Test Manager")
 
-    operation = st.sidebar.radio(
-        "Operation",
-        ["📥 Download Template", "🔄 Excel to Machine CSV",
-         "📤 Machine CSV to Excel", "👀 View Current Test"]
-    )
+    operation = st.sidebar.radio("Operation", _OPERATIONS)
 
     if operation == "📥 Download Template":
-        seal = st.selectbox("Seal Type", ["Main Seal", "Separation Seal"])
-        file_type = "main_seal" if seal == "Main Seal" else "separation_seal"
-        csv_file = "MainSealSet2.csv" if seal == "Main Seal" else "SeperationSeal.csv"
-
-        df = safe_read_csv(csv_file)
+        seal = st.selectbox("Seal Type", _SEAL_TYPES)
+        file_type, df = load_template(seal)
         tech_df = convert_machine_to_technician(df, file_type)
 
         excel = create_professional_excel_from_data(tech_df, file_type)
-        st.download_button("📥 Download Template", excel.getvalue(),
+        st.download_button("📥 Download Template", excel,
             file_name=f"{file_type}_template.xlsx",
             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
 
     elif operation == "🔄 Excel to Machine CSV":
         uploaded = st.file_uploader("Upload Excel", type=['xlsx'])
         if uploaded:
-            df = pd.read_excel(uploaded, sheet_name='TEST_SEQUENCE')
+            df = pd.read_excel(uploaded, sheet_name='TEST_SEQUENCE', engine='calamine')
             df = df.dropna(subset=['Step']).reset_index(drop=True)
             file_type = detect_file_type(df)
 
             edited = editable_dataframe(df, "excel_editor")
-            mapping = get_column_mapping(file_type)
-
-            machine_df = convert_to_machine_codes(
-                edited.rename(columns=mapping['technician_to_machine'])
-            ).drop(columns=['Step','Notes'], errors='ignore')
 
             st.download_button("📥 Download Machine CSV",
-                machine_df.to_csv(index=False, sep=';'),
+                create_machine_csv(edited, file_type),
                 file_name=f"{file_type}_sequence.csv",
                 mime="text/csv")
 
@@ -308,23 +398,20 @@ def main():
 
             excel = create_professional_excel_from_data(edited, file_type)
             st.download_button("📥 Download Excel",
-                excel.getvalue(),
+                excel,
                 file_name=f"{file_type}_professional.xlsx",
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
 
     elif operation == "👀 View Current Test":
-        seal = st.selectbox("Seal Type", ["Main Seal", "Separation Seal"])
-        file_type = "main_seal" if seal == "Main Seal" else "separation_seal"
-        csv_file = "MainSealSet2.csv" if seal == "Main Seal" else "SeperationSeal.csv"
-
-        df = safe_read_csv(csv_file)
+        seal = st.selectbox("Seal Type", _SEAL_TYPES)
+        file_type, df = load_template(seal)
         edited = editable_dataframe(
             convert_machine_to_technician(df, file_type), "current_editor"
         )
 
         excel = create_professional_excel_from_data(edited, file_type)
         st.download_button("📥 Download Excel",
-            excel.getvalue(),
+            excel,
             file_name=f"current_{file_type}_test.xlsx",
             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
 